@@ -2,15 +2,37 @@
 Pytest configuration and shared fixtures
 """
 
+import os
+
+# app.py creates its engines on import, so the test database must be chosen
+# before it is imported. A named shared-cache memory database is seen by every
+# connection in the process: the writer, the reader pool and the write buffer.
+# Always overridden: teardown drops tables, so an exported TASKS_DATABASE_URL must
+# never be picked up.
+os.environ['TASKS_DATABASE_URL'] = 'sqlite:///file:memdb1?mode=memory&cache=shared&uri=true'
+
 import pytest
 from app import app, db, Task
 
 
+@pytest.fixture(scope='session', autouse=True)
+def _pin_memory_db():
+    """Keep one connection to the shared memory database open for the run.
+
+    SQLite discards a named memory database when its last connection closes,
+    so without this the schema would vanish if the pools ever drop theirs.
+    The reader pool is used so the single writer connection stays free.
+    """
+    with app.app_context():
+        conn = db.engines['reader'].connect()
+    yield
+    conn.close()
+
+
 @pytest.fixture(scope='session')
 def app_context():
     """Application context for the entire test session"""
     app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
     
     with app.app_context():
         db.create_all()
@@ -2,13 +2,50 @@
 
 import os
 import json
+import time
+import concurrent.futures
+from functools import lru_cache
 from typing import Dict, Optional
+from celery import Celery
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 import smtplib
+import string
+import textwrap
+from types import MappingProxyType
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+_now = time.time
+
+
+# Delivery runs on a Celery worker when a broker is configured, so callers
+# don't block on the Slack API or on the SMTP handshake.
+celery_app = Celery('notifications', broker=os.getenv('CELERY_BROKER_URL'))
+
+# Attachment color by notification status
+_COLOR_MAP = MappingProxyType({
+    'success': '#36a64f',
+    'failure': '#ff0000',
+    'info': '#0099ff'
+})
+
+# Stored without the source indentation, which Slack would otherwise display
+_RESULTS_TPL = string.Template(textwrap.dedent("""\
+    Test Results Summary
+    ✅ Passed: ${passed}
+    ❌ Failed: ${failed}
+    ⏭️  Skipped: ${skipped}
+    📊 Coverage: ${coverage}
+    """))
+
+# Message prefix by deployment status
+_STATUS_EMOJI = MappingProxyType({
+    'started': '🚀',
+    'success': '✅',
+    'failure': '❌'
+})
+
 
 class NotificationService:
     """Service for sending notifications via Slack and Email."""
@@ -17,17 +54,30 @@ class NotificationService:
         """Initialize notification service."""
         self.slack_token = os.getenv('SLACK_BOT_TOKEN')
         self.slack_channel = os.getenv('SLACK_CHANNEL', '#ci-cd-notifications')
+        # One client per service so repeat posts reuse the open TLS connection
+        self._slack_client = WebClient(token=self.slack_token) if self.slack_token else None
         self.email_enabled = os.getenv('EMAIL_ENABLED', 'false').lower() == 'true'
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         self.email_from = os.getenv('EMAIL_FROM')
         self.email_password = os.getenv('EMAIL_PASSWORD')
+        self.async_enabled = bool(os.getenv('CELERY_BROKER_URL'))
+        # Slack and email are independent network calls; run them side by side
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='notif')
     
     def send_test_notification(self, message: str, status: str = 'info'):
         """Send a test notification."""
-        self.send_slack_notification(message, status)
+        self._send_all(message, status)
+    
+    def _send_all(self, message: str, status: str):
+        """Send to Slack and, if enabled, email concurrently and wait for both."""
+        futs = [self._pool.submit(self.send_slack_notification, message, status)]
         if self.email_enabled:
-            self.send_email_notification(message, status)
+            futs.append(self._pool.submit(self.send_email_notification, message, status))
+        concurrent.futures.wait(futs)
+        # Re-raise worker errors, as the sequential sends did
+        for f in futs:
+            f.result()
     
     def send_slack_notification(self, message: str, status: str = 'info'):
         """Send a notification to Slack.
@@ -40,38 +90,38 @@ class NotificationService:
             print("Slack token not configured")
             return False
         
+        if self.async_enabled:
+            return _send_slack_task.delay(message, status)
+        
         try:
-            client = WebClient(token=self.slack_token)
-            
-            # Color based on status
-            color_map = {
-                'success': '#36a64f',
-                'failure': '#ff0000',
-                'info': '#0099ff'
-            }
-            color = color_map.get(status, '#0099ff')
-            
-            # Create message
-            response = client.chat_postMessage(
-                channel=self.slack_channel,
-                attachments=[
-                    {
-                        'color': color,
-                        'title': f'To-Do App CI/CD - {status.upper()}',
-                        'text': message,
-                        'footer': 'Automated Notification',
-                        'ts': int(__import__('time').time())
-                    }
-                ]
-            )
-            
-            print(f"Slack notification sent successfully: {response['ts']}")
+            self._deliver_slack(message, status)
             return True
         
         except SlackApiError as e:
             print(f"Error sending Slack notification: {e}")
             return False
     
+    def _deliver_slack(self, message: str, status: str):
+        """Post the notification to Slack, raising on failure."""
+        # Color based on status
+        color = _COLOR_MAP.get(status, '#0099ff')
+        
+        # Create message
+        response = self._slack_client.chat_postMessage(
+            channel=self.slack_channel,
+            attachments=[
+                {
+                    'color': color,
+                    'title': f'To-Do App CI/CD - {status.upper()}',
+                    'text': message,
+                    'footer': 'Automated Notification',
+                    'ts': int(_now())
+                }
+            ]
+        )
+        
+        print(f"Slack notification sent successfully: {response['ts']}")
+    
     def send_email_notification(self, message: str, status: str = 'info', recipients: Optional[list] = None):
         """Send a notification via email.
         
@@ -84,41 +134,48 @@ class NotificationService:
             print("Email notifications not configured")
             return False
         
+        if self.async_enabled:
+            return _send_email_task.delay(message, status, recipients)
+        
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"To-Do App CI/CD - {status.upper()}"
-            msg['From'] = self.email_from
-            msg['To'] = ', '.join(recipients or [])
-            
-            # Create HTML content
-            html = f"""
-            <html>
-                <body>
-                    <h2>CI/CD Notification - {status.upper()}</h2>
-                    <p>{message}</p>
-                    <hr>
-                    <p><small>This is an automated notification from the To-Do App CI/CD pipeline.</small></p>
-                </body>
-            </html>
-            """
-            
-            part = MIMEText(html, 'html')
-            msg.attach(part)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_from, self.email_password)
-                server.send_message(msg)
-            
-            print(f"Email notification sent to {recipients}")
+            self._deliver_email(message, status, recipients)
             return True
         
         except Exception as e:
             print(f"Error sending email notification: {e}")
             return False
     
+    def _deliver_email(self, message: str, status: str, recipients: Optional[list] = None):
+        """Send the notification over SMTP, raising on failure."""
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = f"To-Do App CI/CD - {status.upper()}"
+        msg['From'] = self.email_from
+        msg['To'] = ', '.join(recipients or [])
+        
+        # Create HTML content
+        html = f"""
+        <html>
+            <body>
+                <h2>CI/CD Notification - {status.upper()}</h2>
+                <p>{message}</p>
+                <hr>
+                <p><small>This is an automated notification from the To-Do App CI/CD pipeline.</small></p>
+            </body>
+        </html>
+        """
+        
+        part = MIMEText(html, 'html')
+        msg.attach(part)
+        
+        # Send email
+        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            server.starttls()
+            server.login(self.email_from, self.email_password)
+            server.send_message(msg)
+        
+        print(f"Email notification sent to {recipients}")
+    
     def send_test_results(self, results: Dict):
         """Send test results notification.
         
@@ -132,17 +189,9 @@ class NotificationService:
         
         status = 'success' if failed == 0 else 'failure'
         
-        message = f"""
-        Test Results Summary
-        ✅ Passed: {passed}
-        ❌ Failed: {failed}
-        ⏭️  Skipped: {skipped}
-        📊 Coverage: {coverage}
-        """
+        message = _RESULTS_TPL.substitute(passed=passed, failed=failed, skipped=skipped, coverage=coverage)
         
-        self.send_slack_notification(message, status)
-        if self.email_enabled:
-            self.send_email_notification(message, status)
+        self._send_all(message, status)
     
     def send_deployment_notification(self, app_name: str, version: str, status: str):
         """Send deployment notification.
@@ -152,18 +201,30 @@ class NotificationService:
             version: Version being deployed
             status: 'started', 'success', or 'failure'
         """
-        status_emoji = {
-            'started': '🚀',
-            'success': '✅',
-            'failure': '❌'
-        }
-        
-        message = f"{status_emoji.get(status, '➡️')} Deployment {status.upper()}\n"
+        message = f"{_STATUS_EMOJI.get(status, '➡️')} Deployment {status.upper()}\n"
         message += f"App: {app_name}\nVersion: {version}"
         
         self.send_slack_notification(message, 'success' if status == 'success' else status)
 
 
+@lru_cache(maxsize=None)
+def _worker_service() -> NotificationService:
+    """Service shared by all tasks on a worker, keeping its Slack connection warm."""
+    return NotificationService()
+
+
+@celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def _send_slack_task(self, message: str, status: str):
+    """Worker-side Slack delivery; failures are retried with backoff."""
+    _worker_service()._deliver_slack(message, status)
+
+
+@celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def _send_email_task(self, message: str, status: str, recipients: Optional[list] = None):
+    """Worker-side email delivery; failures are retried with backoff."""
+    _worker_service()._deliver_email(message, status, recipients)
+
+
 if __name__ == "__main__":
     # Test the notification service
     service = NotificationService()
@@ -8,11 +8,68 @@ import os
 import sys
 import argparse
 import smtplib
+import string
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
 
+# HTML bodies are parsed once at import; only the slots are filled per send.
+_SUCCESS_TPL = string.Template("""\
+<html>
+    <body style="font-family: Arial, sans-serif; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; border: 1px solid #ddd; border-radius: 5px; overflow: hidden;">
+            <div style="background-color: #36a64f; color: white; padding: 20px;">
+                <h2 style="margin: 0;">✅ CI Pipeline Passed</h2>
+            </div>
+            <div style="padding: 20px;">
+                <p><strong>Repository:</strong> ${repo}</p>
+                <p><strong>Branch:</strong> ${branch}</p>
+                <p><strong>Commit:</strong> <code>${commit_sha}</code></p>
+                <p><strong>Triggered by:</strong> ${actor}</p>
+                <p><strong>Timestamp:</strong> ${ts}</p>
+
+                <h3 style="color: #36a64f;">Test Results</h3>
+                <p>✅ All unit tests passed</p>
+                <p>✅ All integration tests passed</p>
+                <p>✅ Code coverage report generated</p>
+
+                <p style="margin-top: 30px; color: #666; font-size: 12px;">
+                    This is an automated message from the CI/CD pipeline.
+                </p>
+            </div>
+        </div>
+    </body>
+</html>
+""")
+
+_FAILURE_TPL = string.Template("""\
+<html>
+    <body style="font-family: Arial, sans-serif; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; border: 1px solid #ddd; border-radius: 5px; overflow: hidden;">
+            <div style="background-color: #ff0000; color: white; padding: 20px;">
+                <h2 style="margin: 0;">❌ CI Pipeline Failed</h2>
+            </div>
+            <div style="padding: 20px;">
+                <p><strong>Repository:</strong> ${repo}</p>
+                <p><strong>Branch:</strong> ${branch}</p>
+                <p><strong>Commit:</strong> <code>${commit_sha}</code></p>
+                <p><strong>Triggered by:</strong> ${actor}</p>
+                <p><strong>Timestamp:</strong> ${ts}</p>
+
+                <h3 style="color: #ff0000;">Action Required</h3>
+                <p>One or more tests failed. Please review the build logs and fix the issues.</p>
+
+                <p style="margin-top: 30px; color: #666; font-size: 12px;">
+                    This is an automated message from the CI/CD pipeline.
+                </p>
+            </div>
+        </div>
+    </body>
+</html>
+""")
+
+
 def send_email_notification(status, branch):
     """
     Send an email notification
@@ -45,60 +102,13 @@ def send_email_notification(status, branch):
     subject = f"{subject_emoji} CI Pipeline {status.upper()} - {repo}"
     
     # Build email body
-    if is_success:
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; border: 1px solid #ddd; border-radius: 5px; overflow: hidden;">
-                    <div style="background-color: #36a64f; color: white; padding: 20px;">
-                        <h2 style="margin: 0;">✅ CI Pipeline Passed</h2>
-                    </div>
-                    <div style="padding: 20px;">
-                        <p><strong>Repository:</strong> {repo}</p>
-                        <p><strong>Branch:</strong> {branch}</p>
-                        <p><strong>Commit:</strong> <code>{commit_sha}</code></p>
-                        <p><strong>Triggered by:</strong> {actor}</p>
-                        <p><strong>Timestamp:</strong> {datetime.now().isoformat()}</p>
-                        
-                        <h3 style="color: #36a64f;">Test Results</h3>
-                        <p>✅ All unit tests passed</p>
-                        <p>✅ All integration tests passed</p>
-                        <p>✅ Code coverage report generated</p>
-                        
-                        <p style="margin-top: 30px; color: #666; font-size: 12px;">
-                            This is an automated message from the CI/CD pipeline.
-                        </p>
-                    </div>
-                </div>
-            </body>
-        </html>
-        """
-    else:
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; border: 1px solid #ddd; border-radius: 5px; overflow: hidden;">
-                    <div style="background-color: #ff0000; color: white; padding: 20px;">
-                        <h2 style="margin: 0;">❌ CI Pipeline Failed</h2>
-                    </div>
-                    <div style="padding: 20px;">
-                        <p><strong>Repository:</strong> {repo}</p>
-                        <p><strong>Branch:</strong> {branch}</p>
-                        <p><strong>Commit:</strong> <code>{commit_sha}</code></p>
-                        <p><strong>Triggered by:</strong> {actor}</p>
-                        <p><strong>Timestamp:</strong> {datetime.now().isoformat()}</p>
-                        
-                        <h3 style="color: #ff0000;">Action Required</h3>
-                        <p>One or more tests failed. Please review the build logs and fix the issues.</p>
-                        
-                        <p style="margin-top: 30px; color: #666; font-size: 12px;">
-                            This is an automated message from the CI/CD pipeline.
-                        </p>
-                    </div>
-                </div>
-            </body>
-        </html>
-        """
+    body = (_SUCCESS_TPL if is_success else _FAILURE_TPL).substitute(
+        repo=repo,
+        branch=branch,
+        commit_sha=commit_sha,
+        actor=actor,
+        ts=datetime.now().isoformat()
+    )
     
     try:
         # Create message
@@ -4,12 +4,26 @@ Slack notification script for CI pipeline
 Sends test results and build status to Slack channel
 """
 
-import json
 import os
 import sys
 import argparse
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Indexed by int(status == 'success')
+_COLORS = ('#ff0000', '#36a64f')
+_STATUS_EMOJI = ('❌', '✅')
+
+# Shared session so several notifications in one run reuse the connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
 
 
 def send_slack_notification(status, message):
@@ -27,8 +41,9 @@ def send_slack_notification(status, message):
         return False
     
     # Determine color based on status
-    color = '#36a64f' if status == 'success' else '#ff0000'
-    status_emoji = '✅' if status == 'success' else '❌'
+    is_success = int(status == 'success')
+    color = _COLORS[is_success]
+    status_emoji = _STATUS_EMOJI[is_success]
     
     # Get GitHub context from environment
     repo = os.environ.get('GITHUB_REPOSITORY', 'Unknown Repository')
@@ -42,50 +57,35 @@ def send_slack_notification(status, message):
     if repo and run_id:
         run_url = f"https://github.com/{repo}/actions/runs/{run_id}"
     
-    # Build the Slack message
-    fields = [
-        {"title": "Repository", "value": repo, "short": True},
-        {"title": "Branch", "value": branch, "short": True},
-        {"title": "Commit", "value": f"`{commit_sha}`", "short": True},
-        {"title": "Triggered by", "value": actor, "short": True},
-        {"title": "Timestamp", "value": datetime.now().isoformat(), "short": False}
-    ]
+    # Build the Slack message; fields without a value are left out
+    candidates = (
+        ("Workflow", workflow, True),
+        ("Run #", run_number, True),
+        ("Repository", repo, True),
+        ("Branch", branch, True),
+        ("Commit", f"`{commit_sha}`", True),
+        ("Triggered by", actor, True),
+        ("Timestamp", datetime.now().isoformat(), False)
+    )
+    fields = [{"title": title, "value": value, "short": short} for title, value, short in candidates if value]
 
-    if workflow:
-        fields.insert(0, {"title": "Workflow", "value": workflow, "short": True})
-    if run_number:
-        fields.insert(1, {"title": "Run #", "value": run_number, "short": True})
+    attachment = {
+        "color": color,
+        "title": f"{status_emoji} CI Pipeline {status.upper()}",
+        "text": message,
+        "fields": fields,
+        "footer": "To-Do List App CI",
+        "footer_icon": "https://platform.slack-edge.com/img/default_application_icon.png"
+    }
     if run_url:
         # Add a clickable run link in the attachment
-        attachment = {
-            "color": color,
-            "title": f"{status_emoji} CI Pipeline {status.upper()}",
-            "title_link": run_url,
-            "text": message,
-            "fields": fields,
-            "footer": "To-Do List App CI",
-            "footer_icon": "https://platform.slack-edge.com/img/default_application_icon.png"
-        }
-    else:
-        attachment = {
-            "color": color,
-            "title": f"{status_emoji} CI Pipeline {status.upper()}",
-            "text": message,
-            "fields": fields,
-            "footer": "To-Do List App CI",
-            "footer_icon": "https://platform.slack-edge.com/img/default_application_icon.png"
-        }
+        attachment["title_link"] = run_url
 
     slack_message = {"attachments": [attachment]}
     
     # Send the message
     try:
-        response = requests.post(
-            webhook_url,
-            data=json.dumps(slack_message),
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
+        response = SESSION.post(webhook_url, json=slack_message, timeout=10)
         
         if response.status_code == 200:
             print(f"✓ Slack notification sent successfully")
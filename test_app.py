@@ -5,14 +5,18 @@ Tests cover Flask routes and database operations
 
 import pytest
 import json
-from app import app, db, Task
+import orjson
+from concurrent.futures import Future
+from sqlalchemy.exc import IntegrityError
+from app import app, db, Task, write_buffer
+
+_loads = orjson.loads
 
 
 @pytest.fixture
 def client():
     """Create a test client for the Flask application"""
     app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
     
     with app.app_context():
         db.create_all()
@@ -46,6 +50,13 @@ class TestHomeRoute:
         """Test that home route returns HTML content"""
         response = client.get('/')
         assert b'<!DOCTYPE html>' in response.data or b'<html' in response.data
+    
+    def test_home_route_revalidates_with_etag(self, client):
+        """Test that a matching If-None-Match gets 304 with no body"""
+        etag = client.get('/').headers['ETag']
+        response = client.get('/', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
 
 
 class TestGetTasksAPI:
@@ -55,14 +66,14 @@ class TestGetTasksAPI:
         """Test retrieving tasks when database is empty"""
         response = client.get('/api/tasks')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data == []
     
     def test_get_tasks_with_existing_tasks(self, client, sample_task):
         """Test retrieving tasks when tasks exist"""
         response = client.get('/api/tasks')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data) >= 1
         assert data[0]['title'] == 'Test Task'
         assert data[0]['completed'] is False
@@ -70,10 +81,22 @@ class TestGetTasksAPI:
     def test_get_tasks_returns_correct_structure(self, client, sample_task):
         """Test that each task has correct structure"""
         response = client.get('/api/tasks')
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert 'id' in data[0]
         assert 'title' in data[0]
         assert 'completed' in data[0]
+    
+    def test_get_tasks_filtered_by_completed(self, client):
+        """Test that ?completed= only returns tasks with that status"""
+        with app.app_context():
+            db.session.add_all([Task(title='Open', completed=False), Task(title='Done', completed=True)])
+            db.session.commit()
+        response = client.get('/api/tasks?completed=true')
+        assert [t['title'] for t in _loads(response.data)] == ['Done']
+        response = client.get('/api/tasks?completed=false')
+        assert [t['title'] for t in _loads(response.data)] == ['Open']
+        response = client.get('/api/tasks?completed=yes')
+        assert response.status_code == 400
 
 
 class TestCreateTaskAPI:
@@ -86,11 +109,47 @@ class TestCreateTaskAPI:
             content_type='application/json'
         )
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data['title'] == 'New Task'
         assert data['completed'] is False
         assert 'id' in data
     
+    def test_create_task_with_malformed_json_returns_400(self, client):
+        """Test that an undecodable body is rejected rather than erroring"""
+        response = client.post('/api/tasks',
+            data='{"title": ',
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize('body', [{}, {'title': None}, {'title': 3}])
+    def test_create_task_without_valid_title_returns_400(self, client, body):
+        """Test that a missing or non-string title is rejected"""
+        response = client.post('/api/tasks',
+            data=json.dumps(body),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize('body', ['["a", "b"]', 'null', '3', '"x"'])
+    def test_create_task_with_non_object_json_returns_400(self, client, body):
+        """Test that valid JSON that is not an object is rejected"""
+        response = client.post('/api/tasks',
+            data=body,
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+    
+    def test_create_task_times_out_with_503(self, client, monkeypatch):
+        """Test that a write the buffer never resolves gives 503, not a hang"""
+        monkeypatch.setattr('app.WRITE_TIMEOUT', 0.01)
+        monkeypatch.setattr(write_buffer, 'submit', lambda title: Future())
+        response = client.post('/api/tasks',
+            data=json.dumps({'title': 'Stuck'}),
+            content_type='application/json'
+        )
+        assert response.status_code == 503
+    
     def test_create_task_persists_to_database(self, client):
         """Test that created task is stored in database"""
         client.post('/api/tasks',
@@ -98,7 +157,7 @@ class TestCreateTaskAPI:
             content_type='application/json'
         )
         response = client.get('/api/tasks')
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data) == 1
         assert data[0]['title'] == 'Persistent Task'
     
@@ -110,10 +169,82 @@ class TestCreateTaskAPI:
                 content_type='application/json'
             )
         response = client.get('/api/tasks')
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data) == 3
 
 
+class TestBulkCreateTaskAPI:
+    """Test cases for POST /api/tasks/bulk endpoint"""
+    
+    def test_bulk_create_returns_created_tasks(self, client):
+        """Test that every title comes back as a new open task, in order"""
+        titles = [f'Bulk {i}' for i in range(3)]
+        response = client.post('/api/tasks/bulk',
+            data=json.dumps({'titles': titles}),
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+        data = _loads(response.data)
+        assert [t['title'] for t in data] == titles
+        assert all(t['completed'] is False for t in data)
+        assert len({t['id'] for t in data}) == 3
+    
+    def test_bulk_create_persists_to_database(self, client):
+        """Test that bulk-created tasks are listed afterwards"""
+        client.post('/api/tasks/bulk',
+            data=json.dumps({'titles': ['One', 'Two']}),
+            content_type='application/json'
+        )
+        response = client.get('/api/tasks')
+        data = _loads(response.data)
+        assert [t['title'] for t in data] == ['One', 'Two']
+    
+    def test_bulk_create_with_no_titles(self, client):
+        """Test that an empty list creates nothing"""
+        response = client.post('/api/tasks/bulk',
+            data=json.dumps({'titles': []}),
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+        assert _loads(response.data) == []
+    
+    @pytest.mark.parametrize('body', [{}, [], None, {'titles': 'abc'}, {'titles': {'a': 1}}, {'titles': ['ok', 3]}])
+    def test_bulk_create_without_title_list_returns_400(self, client, body):
+        """Test that anything but a list of strings is rejected"""
+        response = client.post('/api/tasks/bulk',
+            data=json.dumps(body),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert _loads(client.get('/api/tasks').data) == []
+
+
+class TestWriteBuffer:
+    """Test cases for the buffered task writer"""
+    
+    def test_burst_resolves_to_matching_ids(self, client):
+        """Test that each queued insert resolves to the id of its own row"""
+        futures = [write_buffer.submit(f'Burst {i}') for i in range(5)]
+        ids = [future.result() for future in futures]
+        assert len(set(ids)) == 5
+        
+        response = client.get('/api/tasks')
+        titles = {t['id']: t['title'] for t in _loads(response.data)}
+        assert [titles[task_id] for task_id in ids] == [f'Burst {i}' for i in range(5)]
+    
+    def test_bad_row_only_fails_its_own_submit(self, client):
+        """Test that a failing row in a batch doesn't fail its neighbours"""
+        batch = [(title, Future()) for title in ('ok1', None, 'ok2')]
+        write_buffer._flush(batch)
+        futures = [future for _, future in batch]
+        assert futures[0].result() != futures[2].result()
+        with pytest.raises(IntegrityError):
+            futures[1].result()
+        
+        response = client.get('/api/tasks')
+        assert [t['title'] for t in _loads(response.data)] == ['ok1', 'ok2']
+
+
 class TestUpdateTaskAPI:
     """Test cases for PATCH /api/tasks/<id> endpoint"""
     
@@ -126,7 +257,7 @@ class TestUpdateTaskAPI:
             content_type='application/json'
         )
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data['completed'] is True
     
     def test_update_nonexistent_task_returns_404(self, client):
@@ -137,6 +268,31 @@ class TestUpdateTaskAPI:
         )
         assert response.status_code == 404
     
+    def test_update_with_non_bool_completed_returns_400(self, client, sample_task):
+        """Test that a non-boolean 'completed' is rejected and not stored"""
+        with app.app_context():
+            task_id = sample_task.id
+        response = client.patch(f'/api/tasks/{task_id}',
+            data=json.dumps({'completed': 'false'}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        response = client.get(f'/api/tasks/{task_id}')
+        assert _loads(response.data)['completed'] is False
+    
+    def test_update_without_completed_keeps_status(self, client, sample_task):
+        """Test that a PATCH body without 'completed' leaves the status alone"""
+        with app.app_context():
+            task_id = sample_task.id
+        response = client.patch(f'/api/tasks/{task_id}',
+            data=json.dumps({}),
+            content_type='application/json'
+        )
+        assert response.status_code == 200
+        data = _loads(response.data)
+        assert data['completed'] is False
+        assert data['title'] == 'Test Task'
+    
     def test_update_task_preserves_title(self, client, sample_task):
         """Test that updating status doesn't change title"""
         with app.app_context():
@@ -148,7 +304,7 @@ class TestUpdateTaskAPI:
         )
         
         response = client.get(f'/api/tasks')
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data[0]['title'] == original_title
 
 
@@ -168,7 +324,7 @@ class TestDeleteTaskAPI:
             task_id = sample_task.id
         client.delete(f'/api/tasks/{task_id}')
         response = client.get('/api/tasks')
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data) == 0
     
     def test_delete_nonexistent_task_returns_404(self, client):